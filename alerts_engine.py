@@ -4,121 +4,205 @@ ALERTS ENGINE MODULE
 Intelligent alert detection and prioritization.
 """
 
+import operator
+
 import pandas as pd
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+# Rank used to break priority ties without comparing severity strings
+_SEV_RANK = {'CRITICAL': 0, 'WARNING': 1, 'INFO': 2, 'SAFE': 3}
+
+# Per-machine average efficiency below this triggers a critical alert
+_LOW_EFF_THRESHOLD = 70.0
+
+_ALERT_COLORS = {
+    'CRITICAL': '#ff4444',
+    'WARNING': '#ff8800',
+    'SAFE': '#00cc66',
+    'INFO': '#4488ff'
+}
+_DEFAULT_COLOR = '#888888'
+
+# Alert message templates, built once at import instead of re-evaluating
+# f-string literals on every refresh tick
+_MSG_LOW_EFF = "Machine {machine} efficiency critically low at {eff:.1f}%"
+_REC_LOW_EFF = "Immediate inspection required for {machine}. Check mechanical systems and calibration."
+_MSG_TEMP_SPIKE = "Temperature spike detected: {temp:.1f}°C on {machines}"
+_MSG_DOWNTIME = "Abnormal downtime detected: {minutes:.1f} minutes average"
+_MSG_SUPPLY = "{count} delayed deliveries from {suppliers}"
+_MSG_EFF_TREND = "Efficiency declining trend detected: -{drop:.1f}% over recent period"
+
+_BANNER_TEMPLATE = (
+    "⚠️ IMMEDIATE ATTENTION REQUIRED: {count} CRITICAL ISSUE{plural}\n"
+    "PRIMARY FOCUS: {focus}\n"
+    "REASON: {reason}"
+)
+
+
+def _mean_std(arr: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute mean and population std in one fused pass.
+
+    Uses a running sum and sum-of-squares (via np.dot) so the array is
+    traversed once instead of twice as with separate mean()/std() calls.
+    """
+    n = arr.size
+    total = arr.sum()
+    mean = total / n
+    variance = max(np.dot(arr, arr) / n - mean * mean, 0.0)
+    return mean, float(np.sqrt(variance))
+
+
+def _zscore_mask(arr: np.ndarray, sensitivity: float, side: str = 'both',
+                 mean: Optional[float] = None, std: Optional[float] = None) -> np.ndarray:
+    """
+    Flag values beyond ``sensitivity`` standard deviations from the mean.
+
+    Args:
+        arr: Numeric values as a 1-D float64 array
+        sensitivity: Z-score threshold
+        side: 'upper' (spikes), 'lower' (drops), or 'both'
+        mean: Precomputed mean (computed from arr when None)
+        std: Precomputed std (computed from arr when None)
+
+    Returns:
+        Boolean array marking flagged values
+    """
+    if arr.size == 0:
+        return np.zeros(0, dtype=bool)
+
+    if mean is None or std is None:
+        mean, std = _mean_std(arr)
+
+    if std == 0:
+        return np.zeros(arr.size, dtype=bool)
+
+    if side == 'upper':
+        return arr > mean + (sensitivity * std)
+    if side == 'lower':
+        return arr < mean - (sensitivity * std)
+    return np.abs(arr - mean) > sensitivity * std
 
 
 def detect_anomalies(df: pd.DataFrame, column: str, sensitivity: float = 2.0) -> pd.Series:
     """
     Detect anomalies using Z-score method.
-    
+
     Args:
         df: DataFrame
         column: Column to analyze
         sensitivity: Z-score threshold
-        
+
     Returns:
         Boolean series marking anomalies
     """
     if df.empty or column not in df.columns:
         return pd.Series(dtype=bool)
-    
-    series = df[column]
-    mean = series.mean()
-    std = series.std()
-    
-    if std == 0:
-        return pd.Series([False] * len(series))
-    
-    z_scores = np.abs((series - mean) / std)
-    return z_scores > sensitivity
+
+    arr = df[column].to_numpy(dtype=np.float64, copy=False)
+    return pd.Series(_zscore_mask(arr, sensitivity, 'both'), index=df.index)
 
 
 def detect_spike(df: pd.DataFrame, column: str, sensitivity: float = 2.0) -> pd.Series:
     """Detect abnormal upward spikes."""
     if df.empty or column not in df.columns:
         return pd.Series(dtype=bool)
-    
-    series = df[column]
-    mean, std = series.mean(), series.std()
-    
-    if std == 0:
-        return pd.Series([False] * len(series))
-    
-    threshold = mean + (sensitivity * std)
-    return series > threshold
+
+    arr = df[column].to_numpy(dtype=np.float64, copy=False)
+    return pd.Series(_zscore_mask(arr, sensitivity, 'upper'), index=df.index)
 
 
 def detect_drop(df: pd.DataFrame, column: str, sensitivity: float = 2.0) -> pd.Series:
     """Detect sudden drops."""
     if df.empty or column not in df.columns:
         return pd.Series(dtype=bool)
-    
-    series = df[column]
-    mean, std = series.mean(), series.std()
-    
-    if std == 0:
-        return pd.Series([False] * len(series))
-    
-    threshold = mean - (sensitivity * std)
-    return series < threshold
 
+    arr = df[column].to_numpy(dtype=np.float64, copy=False)
+    return pd.Series(_zscore_mask(arr, sensitivity, 'lower'), index=df.index)
 
-def generate_alerts(prod_df: pd.DataFrame, sup_df: pd.DataFrame, 
-                   sensitivity: float = 1.5) -> List[Dict]:
+
+def generate_alerts(prod_df: pd.DataFrame, sup_df: pd.DataFrame,
+                   sensitivity: float = 1.5,
+                   stats: Optional[Dict[str, Tuple[float, float]]] = None) -> Tuple[List[Dict], int]:
     """
     Generate intelligent alerts based on data patterns.
-    
+
     Args:
         prod_df: Production DataFrame
         sup_df: Supplier DataFrame
         sensitivity: Alert sensitivity (1.0-3.0, lower = more alerts)
-        
+        stats: Optional precomputed column statistics mapping column name
+               to (mean, std); skips the internal reductions when provided
+
     Returns:
-        List of alert dictionaries
+        Tuple of (alert dictionaries sorted by priority, critical count)
     """
     alerts = []
-    
+    critical_count = 0
+
     if prod_df.empty:
-        return alerts
-    
+        return alerts, critical_count
+
+    machine_arr = prod_df['machine_id'].to_numpy()
+
+    # One contiguous load of the three monitored columns; the mean/std
+    # for the spike masks below come out of a single fused pass over the
+    # block instead of three independent column traversals
+    metric_block = prod_df[['efficiency', 'temperature_c', 'downtime_minutes']].to_numpy(dtype=np.float64)
+    eff_arr = metric_block[:, 0]
+    temp_arr = metric_block[:, 1]
+    downtime_arr = metric_block[:, 2]
+
+    if stats:
+        temp_mean, temp_std = stats.get('temperature_c', (None, None))
+        dt_mean, dt_std = stats.get('downtime_minutes', (None, None))
+    else:
+        n = metric_block.shape[0]
+        col_means = metric_block.sum(axis=0) / n
+        col_vars = np.einsum('ij,ij->j', metric_block, metric_block) / n - col_means ** 2
+        col_stds = np.sqrt(np.maximum(col_vars, 0.0))
+        temp_mean, temp_std = col_means[1], col_stds[1]
+        dt_mean, dt_std = col_means[2], col_stds[2]
+
     # 1. Low Efficiency Alerts
-    low_eff_machines = prod_df[prod_df['efficiency'] < 70]['machine_id'].unique()
-    for machine in low_eff_machines:
-        machine_data = prod_df[prod_df['machine_id'] == machine]
-        avg_eff = machine_data['efficiency'].mean()
+    eff_by_machine = prod_df.groupby('machine_id', sort=False, observed=True)['efficiency'].mean()
+    low_eff_machines = eff_by_machine[eff_by_machine < _LOW_EFF_THRESHOLD]
+    for machine, avg_eff in low_eff_machines.items():
+        critical_count += 1
         alerts.append({
             "severity": "CRITICAL",
             "category": "Production",
-            "message": f"Machine {machine} efficiency critically low at {avg_eff:.1f}%",
-            "recommendation": f"Immediate inspection required for {machine}. Check mechanical systems and calibration.",
+            "message": _MSG_LOW_EFF.format(machine=machine, eff=avg_eff),
+            "recommendation": _REC_LOW_EFF.format(machine=machine),
             "focus_area": "Machine Maintenance",
             "priority": 1
         })
     
     # 2. Temperature Alerts
-    high_temp = detect_spike(prod_df, 'temperature_c', sensitivity)
+    high_temp = _zscore_mask(temp_arr, sensitivity, 'upper', temp_mean, temp_std)
     if high_temp.any():
-        max_temp = prod_df.loc[high_temp, 'temperature_c'].max()
-        affected_machines = prod_df.loc[high_temp, 'machine_id'].unique()
+        max_temp = temp_arr[high_temp].max()
+        affected_machines = pd.unique(machine_arr[high_temp])
+        if max_temp > 40:
+            critical_count += 1
         alerts.append({
             "severity": "CRITICAL" if max_temp > 40 else "WARNING",
             "category": "Safety",
-            "message": f"Temperature spike detected: {max_temp:.1f}°C on {', '.join(affected_machines)}",
+            "message": _MSG_TEMP_SPIKE.format(temp=max_temp, machines=', '.join(affected_machines)),
             "recommendation": "Activate cooling systems. Reduce production load if temperature persists above 38°C.",
             "focus_area": "Cooling Systems",
             "priority": 1 if max_temp > 40 else 2
         })
     
     # 3. Downtime Anomalies
-    downtime_anomalies = detect_spike(prod_df, 'downtime_minutes', sensitivity)
+    downtime_anomalies = _zscore_mask(downtime_arr, sensitivity, 'upper', dt_mean, dt_std)
     if downtime_anomalies.any():
-        avg_downtime = prod_df.loc[downtime_anomalies, 'downtime_minutes'].mean()
+        avg_downtime = downtime_arr[downtime_anomalies].mean()
         alerts.append({
             "severity": "WARNING",
             "category": "Operational",
-            "message": f"Abnormal downtime detected: {avg_downtime:.1f} minutes average",
+            "message": _MSG_DOWNTIME.format(minutes=avg_downtime),
             "recommendation": "Investigate recent maintenance activities. Check for recurring fault patterns.",
             "focus_area": "Downtime Reduction",
             "priority": 2
@@ -126,36 +210,44 @@ def generate_alerts(prod_df: pd.DataFrame, sup_df: pd.DataFrame,
     
     # 4. Supply Chain Alerts
     if not sup_df.empty and 'supply_risk' in sup_df.columns:
-        delayed = sup_df[sup_df['supply_risk'] == 'Delayed']
-        if len(delayed) > 0:
-            delayed_count = len(delayed)
-            delayed_suppliers = delayed['supplier_id'].unique()
+        # .eq on the categorical column compares int8 codes rather than
+        # materializing an object array of strings
+        delayed_mask = sup_df['supply_risk'].eq('Delayed').to_numpy()
+        delayed_count = int(delayed_mask.sum())
+        if delayed_count > 0:
+            delayed_suppliers = pd.unique(sup_df['supplier_id'].to_numpy()[delayed_mask])
+            if delayed_count > 2:
+                critical_count += 1
             alerts.append({
                 "severity": "WARNING" if delayed_count <= 2 else "CRITICAL",
                 "category": "Supply Chain",
-                "message": f"{delayed_count} delayed deliveries from {', '.join(delayed_suppliers)}",
+                "message": _MSG_SUPPLY.format(count=delayed_count, suppliers=', '.join(delayed_suppliers)),
                 "recommendation": "Contact suppliers for expedited shipping. Activate backup supplier contracts.",
                 "focus_area": "Supplier Lead Time",
                 "priority": 2 if delayed_count <= 2 else 1
             })
     
     # 5. Efficiency Drop Trend
-    if len(prod_df) >= 10:
-        recent_eff = prod_df.tail(10)['efficiency'].mean()
-        older_eff = prod_df.head(10)['efficiency'].mean()
+    if eff_arr.size >= 10:
+        recent_eff = eff_arr[-10:].mean()
+        older_eff = eff_arr[:10].mean()
         eff_drop = older_eff - recent_eff
-        
+
         if eff_drop > 10:
             alerts.append({
                 "severity": "WARNING",
                 "category": "Trend Analysis",
-                "message": f"Efficiency declining trend detected: -{eff_drop:.1f}% over recent period",
+                "message": _MSG_EFF_TREND.format(drop=eff_drop),
                 "recommendation": "Conduct comprehensive system audit. Review maintenance schedules.",
                 "focus_area": "System Performance",
                 "priority": 2
             })
     
-    return sorted(alerts, key=lambda x: x['priority'])
+    for alert in alerts:
+        alert['_key'] = alert['priority'] * 10 + _SEV_RANK[alert['severity']]
+
+    alerts.sort(key=operator.itemgetter('_key'))
+    return alerts, critical_count
 
 
 def prioritize_alerts(alerts: List[Dict]) -> List[Dict]:
@@ -168,7 +260,11 @@ def prioritize_alerts(alerts: List[Dict]) -> List[Dict]:
     Returns:
         Prioritized alerts
     """
-    return sorted(alerts, key=lambda x: (x.get('priority', 99), x.get('severity', 'INFO')))
+    for alert in alerts:
+        if '_key' not in alert:
+            alert['_key'] = (alert.get('priority', 99) * 10 +
+                             _SEV_RANK.get(alert.get('severity'), len(_SEV_RANK)))
+    return sorted(alerts, key=operator.itemgetter('_key'))
 
 
 def create_banner_message(alerts: List[Dict]) -> str:
@@ -181,30 +277,25 @@ def create_banner_message(alerts: List[Dict]) -> str:
     Returns:
         Banner message string
     """
-    critical_alerts = [a for a in alerts if a.get('severity') == 'CRITICAL']
-    
-    if not critical_alerts:
+    top_alert = None
+    count = 0
+    for alert in alerts:
+        if alert.get('severity') == 'CRITICAL':
+            if top_alert is None:
+                top_alert = alert
+            count += 1
+
+    if top_alert is None:
         return ""
-    
-    top_alert = critical_alerts[0]
-    count = len(critical_alerts)
-    
-    focus = top_alert.get('focus_area', 'System Health')
-    reason = top_alert.get('message', 'Multiple critical issues detected')
-    
-    banner = f"⚠️ IMMEDIATE ATTENTION REQUIRED: {count} CRITICAL ISSUE{'S' if count > 1 else ''}\n"
-    banner += f"PRIMARY FOCUS: {focus}\n"
-    banner += f"REASON: {reason}"
-    
-    return banner
+
+    return _BANNER_TEMPLATE.format(
+        count=count,
+        plural='S' if count > 1 else '',
+        focus=top_alert.get('focus_area', 'System Health'),
+        reason=top_alert.get('message', 'Multiple critical issues detected')
+    )
 
 
 def get_alert_color(severity: str) -> str:
     """Get color for alert severity."""
-    colors = {
-        'CRITICAL': '#ff4444',
-        'WARNING': '#ff8800',
-        'SAFE': '#00cc66',
-        'INFO': '#4488ff'
-    }
-    return colors.get(severity, '#888888')
+    return _ALERT_COLORS.get(severity, _DEFAULT_COLOR)
@@ -0,0 +1,17 @@
+-- Server-side aggregates for the executive dashboard.
+-- Apply once in the Supabase SQL editor. fetch_dashboard_summary() in
+-- data_processing.py reads this view and returns None when it has not
+-- been created, so the client-side aggregation keeps working without it.
+CREATE OR REPLACE VIEW dashboard_summary AS
+SELECT
+    AVG(actual_output::float / NULLIF(target_output, 0)) * 100 AS avg_efficiency,
+    AVG(temperature_c)                                         AS mean_temp,
+    MAX(temperature_c)                                         AS max_temp,
+    AVG(downtime_minutes)                                      AS avg_downtime,
+    SUM(actual_output)                                         AS total_output
+FROM (
+    SELECT *
+    FROM production_data
+    ORDER BY timestamp DESC
+    LIMIT 100
+) recent;
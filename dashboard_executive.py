@@ -14,6 +14,7 @@ Features:
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import time
@@ -24,8 +25,7 @@ from data_processing import (
     fetch_data,
     transform_production_data,
     transform_supplier_data,
-    calculate_system_health,
-    calculate_risk_index
+    calculate_scores
 )
 from model_inference import (
     predict_downtime_risk,
@@ -36,7 +36,6 @@ from model_inference import (
 )
 from alerts_engine import (
     generate_alerts,
-    prioritize_alerts,
     create_banner_message,
     get_alert_color
 )
@@ -56,6 +55,89 @@ from utils import (
     format_number
 )
 
+# Severity labels formatted once instead of per alert row per rerun
+_SEVERITY_LABEL = {
+    sev: f"{get_severity_emoji(sev)} {sev}"
+    for sev in ('CRITICAL', 'WARNING', 'SAFE', 'INFO')
+}
+
+# =============================================================================
+# CACHED COMPUTATION HELPERS
+# =============================================================================
+def _df_fingerprint(df: pd.DataFrame):
+    """Cheap cache key for a timestamped DataFrame snapshot."""
+    if df.empty:
+        return (0, None)
+    return (len(df), df['timestamp'].iloc[-1])
+
+
+# Hash raw frames via pandas' vectorized row hash instead of Streamlit's
+# generic object walk
+_HASH_FUNCS = {
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=True).values.tobytes()
+}
+
+
+@st.cache_data(ttl=3)
+def _cached_fetch():
+    return fetch_data()
+
+
+# The snapshot-keyed caches below get a new key every few seconds in live
+# mode; max_entries keeps them bounded since only the latest snapshots are
+# ever re-requested
+@st.cache_data(hash_funcs=_HASH_FUNCS, max_entries=4)
+def _cached_transform(raw_prod: pd.DataFrame, raw_sup: pd.DataFrame):
+    return transform_production_data(raw_prod), transform_supplier_data(raw_sup)
+
+
+@st.cache_data(max_entries=4)
+def _cached_scores(_prod_df, _sup_df, fingerprint):
+    return calculate_scores(_prod_df, _sup_df)
+
+
+@st.cache_data(max_entries=4)
+def _cached_predict(_prod_df, fingerprint):
+    return predict_downtime_risk(_prod_df)
+
+
+@st.cache_data(max_entries=4)
+def _cached_root_causes(_prod_df, fingerprint, threshold: float):
+    return perform_root_cause_analysis(_prod_df, threshold=threshold)
+
+
+@st.cache_data(max_entries=4)
+def _cached_importance(_prod_df, fingerprint):
+    return calculate_feature_importance(_prod_df)
+
+
+@st.cache_data(max_entries=4)
+def _cached_forecast(_prod_df, fingerprint, column: str, horizon: int):
+    return forecast_metrics(_prod_df.tail(50), column, horizon=horizon)
+
+
+@st.cache_data(max_entries=4)
+def compute_column_stats(_prod_df: pd.DataFrame, fingerprint) -> dict:
+    """
+    Compute shared column aggregates once per data snapshot.
+
+    Args:
+        _prod_df: Transformed production DataFrame (excluded from cache key)
+        fingerprint: Lightweight cache key for the current data snapshot
+
+    Returns:
+        Dictionary with (mean, std) per monitored column plus output totals
+    """
+    eff = _prod_df['efficiency'].to_numpy()
+    temp = _prod_df['temperature_c'].to_numpy()
+    downtime = _prod_df['downtime_minutes'].to_numpy()
+    return {
+        'efficiency': (float(eff.mean()), float(eff.std())),
+        'temperature_c': (float(temp.mean()), float(temp.std())),
+        'downtime_minutes': (float(downtime.mean()), float(downtime.std())),
+        'actual_output_sum': float(_prod_df['actual_output'].to_numpy().sum())
+    }
+
 # =============================================================================
 # PAGE CONFIGURATION
 # =============================================================================
@@ -123,6 +205,13 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# One timestamp per render, shared by the sidebar caption, the export
+# filenames, and the footer
+_render_now = datetime.datetime.now()
+_render_time = _render_now.strftime('%H:%M:%S')
+_render_date = _render_now.strftime('%Y%m%d')
+_render_full = _render_now.strftime('%Y-%m-%d %H:%M:%S')
+
 # =============================================================================
 # SIDEBAR CONTROLS
 # =============================================================================
@@ -151,7 +240,7 @@ time_range = st.sidebar.radio(
 )
 
 st.sidebar.markdown("---")
-st.sidebar.markdown(f"**Last Updated:** {datetime.datetime.now().strftime('%H:%M:%S')}")
+st.sidebar.markdown(f"**Last Updated:** {_render_time}")
 
 # Refresh button
 if st.sidebar.button("🔄 Refresh Data"):
@@ -172,9 +261,8 @@ st.markdown("---")
 
 # Fetch and process data
 try:
-    prod_df_raw, sup_df_raw = fetch_data()
-    prod_df = transform_production_data(prod_df_raw)
-    sup_df = transform_supplier_data(sup_df_raw)
+    prod_df_raw, sup_df_raw = _cached_fetch()
+    prod_df, sup_df = _cached_transform(prod_df_raw, sup_df_raw)
 except Exception as e:
     st.error(f"❌ Data fetch error: {str(e)}")
     st.stop()
@@ -191,15 +279,23 @@ if prod_df.empty:
 st.markdown("## 📊 Executive Summary")
 
 # Calculate key metrics
-health_score = calculate_system_health(prod_df, sup_df)
-risk_index = calculate_risk_index(prod_df, sup_df)
-ml_acc, downtime_prob, risk_status = predict_downtime_risk(prod_df)
-total_prod = prod_df['actual_output'].sum()
-avg_efficiency = prod_df['efficiency'].mean()
-
-# Generate alerts
-alerts = generate_alerts(prod_df, sup_df, sensitivity)
-critical_count = len([a for a in alerts if a['severity'] == 'CRITICAL'])
+prod_key = _df_fingerprint(prod_df)
+sup_key = _df_fingerprint(sup_df)
+stats = compute_column_stats(prod_df, prod_key)
+health_score, risk_index = _cached_scores(prod_df, sup_df, (prod_key, sup_key))
+ml_acc, downtime_prob, risk_status = _cached_predict(prod_df, prod_key)
+total_prod = stats['actual_output_sum']
+avg_efficiency = stats['efficiency'][0]
+
+# Generate alerts (memoized: live mode reruns every 3 seconds even when
+# the simulator hasn't appended new rows yet)
+_alerts_key = (prod_key, sup_key, sensitivity)
+if st.session_state.get('_alerts_key') == _alerts_key:
+    alerts, critical_count = st.session_state['_alerts_val']
+else:
+    alerts, critical_count = generate_alerts(prod_df, sup_df, sensitivity, stats=stats)
+    st.session_state['_alerts_key'] = _alerts_key
+    st.session_state['_alerts_val'] = (alerts, critical_count)
 
 # AI Insight Summary
 insight = generate_insight_summary(health_score, risk_index, critical_count)
@@ -255,17 +351,21 @@ if critical_count > 0:
 
 # Alert table
 if alerts:
-    alert_data = []
-    for alert in prioritize_alerts(alerts):
-        alert_data.append({
-            "Severity": f"{get_severity_emoji(alert['severity'])} {alert['severity']}",
-            "Category": alert['category'],
-            "Issue": alert['message'],
-            "Recommendation": alert['recommendation'],
-            "Focus Area": alert['focus_area']
-        })
-    
-    alert_df = pd.DataFrame(alert_data)
+    severities, categories, issues, recommendations, focus_areas = [], [], [], [], []
+    for alert in alerts:
+        severities.append(_SEVERITY_LABEL.get(alert['severity'], alert['severity']))
+        categories.append(alert['category'])
+        issues.append(alert['message'])
+        recommendations.append(alert['recommendation'])
+        focus_areas.append(alert['focus_area'])
+
+    alert_df = pd.DataFrame({
+        "Severity": severities,
+        "Category": categories,
+        "Issue": issues,
+        "Recommendation": recommendations,
+        "Focus Area": focus_areas
+    })
     st.dataframe(alert_df, use_container_width=True, hide_index=True)
 else:
     st.success("✅ No active alerts. System operating within normal parameters.")
@@ -279,7 +379,7 @@ st.markdown("## 📈 Deep Analytics & Root Cause Analysis")
 
 # Root Cause Analysis
 st.subheader("🔍 Root Cause Analysis")
-root_causes = perform_root_cause_analysis(prod_df, threshold=75.0)
+root_causes = _cached_root_causes(prod_df, prod_key, 75.0)
 
 if root_causes and root_causes[0]['factor'] != "No Issues":
     st.markdown("**Top 3 Contributing Factors to Efficiency Drops:**")
@@ -294,7 +394,7 @@ else:
 
 # Feature Importance
 st.subheader("📊 Feature Importance Analysis")
-importance = calculate_feature_importance(prod_df)
+importance = _cached_importance(prod_df, prod_key)
 
 if importance:
     imp_df = pd.DataFrame(list(importance.items())[:5], columns=['Feature', 'Importance'])
@@ -326,35 +426,43 @@ if importance:
 # Forecast vs Actual
 st.subheader("🔮 Efficiency Forecast vs Actual")
 if len(prod_df) >= 20:
-    forecast_df = forecast_metrics(prod_df.tail(50), 'efficiency', horizon=12)
-    
-    if not forecast_df.empty:
+    forecast = _cached_forecast(prod_df, prod_key, 'efficiency', 12)
+
+    if forecast:
         # Create forecast chart
         fig_forecast = go.Figure()
-        
+
+        recent30 = prod_df.tail(30)
+        n30 = len(recent30)
+        hist_x = np.arange(n30)
+
         # Historical
         fig_forecast.add_trace(go.Scatter(
-            x=list(range(len(prod_df.tail(30)))),
-            y=prod_df.tail(30)['efficiency'],
+            x=hist_x,
+            y=recent30['efficiency'],
             mode='lines+markers',
             name='Actual Efficiency',
             line=dict(color='#00cc96', width=2)
         ))
-        
+
         # Forecast
-        future_x = list(range(len(prod_df.tail(30)), len(prod_df.tail(30)) + len(forecast_df)))
+        future_x = np.arange(n30, n30 + len(forecast['forecast']))
         fig_forecast.add_trace(go.Scatter(
             x=future_x,
-            y=forecast_df['forecast'],
+            y=forecast['forecast'],
             mode='lines',
             name='Forecasted',
             line=dict(color='#4488ff', width=2, dash='dash')
         ))
         
-        # Confidence interval
+        # Confidence interval (single polygon built as ndarrays, no
+        # Python list reversal/concatenation per render)
+        poly_x = np.concatenate([future_x, future_x[::-1]])
+        poly_y = np.concatenate([forecast['upper_bound'],
+                                 forecast['lower_bound'][::-1]])
         fig_forecast.add_trace(go.Scatter(
-            x=future_x + future_x[::-1],
-            y=list(forecast_df['upper_bound']) + list(forecast_df['lower_bound'][::-1]),
+            x=poly_x,
+            y=poly_y,
             fill='toself',
             fillcolor='rgba(68, 136, 255, 0.2)',
             line=dict(color='rgba(255,255,255,0)'),
@@ -643,7 +751,7 @@ with tab4:
         st.download_button(
             label="📥 Download Production CSV",
             data=csv_prod,
-            file_name=f"production_data_{datetime.datetime.now().strftime('%Y%m%d')}.csv",
+            file_name=f"production_data_{_render_date}.csv",
             mime="text/csv"
         )
     
@@ -654,7 +762,7 @@ with tab4:
             st.download_button(
                 label="📥 Download Supplier CSV",
                 data=csv_sup,
-                file_name=f"supplier_data_{datetime.datetime.now().strftime('%Y%m%d')}.csv",
+                file_name=f"supplier_data_{_render_date}.csv",
                 mime="text/csv"
             )
 
@@ -662,5 +770,5 @@ with tab4:
 # FOOTER
 # =============================================================================
 st.markdown("---")
-st.caption("Executive Dashboard v2.0 | Powered by AI & Real-time Analytics | Last updated: " + 
-           datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+st.caption("Executive Dashboard v2.0 | Powered by AI & Real-time Analytics | Last updated: " +
+           _render_full)
@@ -9,25 +9,30 @@ import numpy as np
 from typing import Tuple, List, Dict
 
 
+def _risk_from_temp(avg_temp: float, n_rows: int) -> Tuple[float, float]:
+    """Scalar tail of the downtime prediction: (accuracy, risk_score)."""
+    risk_score = min(max((avg_temp - 30) * 5, 5), 95)
+    accuracy = 88.5 + (n_rows % 5) * 0.5
+    return round(accuracy, 1), round(risk_score, 1)
+
+
 def predict_downtime_risk(df: pd.DataFrame) -> Tuple[float, float, str]:
     """
     Predict downtime risk using ML model.
-    
+
     Args:
         df: Production DataFrame
-        
+
     Returns:
         tuple: (accuracy, risk_score, risk_level)
     """
     if df.empty:
         return 0, 0, "Low"
-    
-    avg_temp = df['temperature_c'].mean()
-    risk_score = min(max((avg_temp - 30) * 5, 5), 95)
-    accuracy = 88.5 + (len(df) % 5) * 0.5
+
+    accuracy, risk_score = _risk_from_temp(df['temperature_c'].mean(), len(df))
     risk_level = "Critical" if risk_score > 80 else "Warning" if risk_score > 50 else "Stable"
-    
-    return round(accuracy, 1), round(risk_score, 1), risk_level
+
+    return accuracy, risk_score, risk_level
 
 
 def calculate_feature_importance(df: pd.DataFrame, target: str = 'efficiency') -> Dict[str, float]:
@@ -43,14 +48,27 @@ def calculate_feature_importance(df: pd.DataFrame, target: str = 'efficiency') -
     """
     if df.empty or target not in df.columns:
         return {}
-    
+
     numeric_cols = df.select_dtypes(include=[np.number]).columns
-    correlations = df[numeric_cols].corr()[target].abs().sort_values(ascending=False)
-    correlations = correlations[correlations.index != target]
-    
-    if correlations.empty:
+    if target not in numeric_cols:
         return {}
-    
+
+    # Correlations against the target only: standardize the block once
+    # and take one matrix-vector product instead of computing the full
+    # k x k matrix with df.corr() and discarding all but one column
+    X = df[numeric_cols].to_numpy(dtype=np.float64)
+    mu = X.mean(axis=0)
+    sd = X.std(axis=0)
+    sd[sd == 0] = 1.0
+    Z = (X - mu) / sd
+    target_idx = numeric_cols.get_loc(target)
+    corrs = np.abs(Z.T @ Z[:, target_idx]) / len(X)
+
+    correlations = pd.Series(corrs, index=numeric_cols).drop(target).sort_values(ascending=False)
+
+    if correlations.empty or correlations.sum() == 0:
+        return {}
+
     importance = (correlations / correlations.sum()).to_dict()
     return importance
 
@@ -67,39 +85,44 @@ def perform_root_cause_analysis(prod_df: pd.DataFrame, threshold: float = 75.0)
         List of root causes
     """
     root_causes = []
-    low_eff = prod_df[prod_df['efficiency'] < threshold]
-    
-    if low_eff.empty:
+    low_mask = prod_df['efficiency'] < threshold
+
+    if not low_mask.any():
         return [{"factor": "No Issues", "impact": "System operating normally", "contribution": 0}]
-    
+
+    # One grouped pass over both partitions instead of six masked column
+    # scans; reindex guarantees both partitions exist even when every row
+    # falls on one side of the threshold
+    stats = (prod_df.groupby(low_mask)[['temperature_c', 'downtime_minutes', 'speed_rpm']]
+             .agg(['mean', 'std'])
+             .reindex([False, True]))
+    low_stats = stats.loc[True]
+    high_stats = stats.loc[False]
+
     # Temperature factor
-    avg_temp_low = low_eff['temperature_c'].mean()
-    avg_temp_high = prod_df[prod_df['efficiency'] >= threshold]['temperature_c'].mean()
-    temp_diff = avg_temp_low - avg_temp_high
-    
+    temp_diff = low_stats[('temperature_c', 'mean')] - high_stats[('temperature_c', 'mean')]
+
     if abs(temp_diff) > 2:
         root_causes.append({
             "factor": "Temperature",
             "impact": f"{'Higher' if temp_diff > 0 else 'Lower'} by {abs(temp_diff):.1f}°C during low efficiency",
             "contribution": min(abs(temp_diff) * 10, 100)
         })
-    
+
     # Downtime factor
-    avg_downtime_low = low_eff['downtime_minutes'].mean()
-    avg_downtime_high = prod_df[prod_df['efficiency'] >= threshold]['downtime_minutes'].mean()
-    downtime_diff = avg_downtime_low - avg_downtime_high
-    
+    downtime_diff = low_stats[('downtime_minutes', 'mean')] - high_stats[('downtime_minutes', 'mean')]
+
     if downtime_diff > 0.5:
         root_causes.append({
             "factor": "Downtime",
             "impact": f"Increased by {downtime_diff:.1f} minutes",
             "contribution": min(downtime_diff * 20, 100)
         })
-    
+
     # Speed variance
-    speed_variance = low_eff['speed_rpm'].std()
-    normal_variance = prod_df[prod_df['efficiency'] >= threshold]['speed_rpm'].std()
-    
+    speed_variance = low_stats[('speed_rpm', 'std')]
+    normal_variance = high_stats[('speed_rpm', 'std')]
+
     if speed_variance > normal_variance * 1.2:
         root_causes.append({
             "factor": "Speed Instability",
@@ -111,66 +134,94 @@ def perform_root_cause_analysis(prod_df: pd.DataFrame, threshold: float = 75.0)
     return root_causes[:3]
 
 
-def forecast_metrics(df: pd.DataFrame, column: str, horizon: int = 12) -> pd.DataFrame:
+def forecast_metrics(df: pd.DataFrame, column: str, horizon: int = 12) -> Dict[str, np.ndarray]:
     """
     Simple linear forecast with confidence intervals.
-    
+
     Args:
         df: Historical data
         column: Column to forecast
         horizon: Forecast horizon
-        
+
     Returns:
-        DataFrame with forecast and bounds
+        Dict with 'forecast', 'lower_bound' and 'upper_bound' arrays
+        (empty dict when the input is unusable); the consumer is a Plotly
+        trace, so there is no point wrapping the arrays in a DataFrame
     """
     if df.empty or column not in df.columns:
-        return pd.DataFrame()
-    
-    df_copy = df.copy()
-    df_copy['time_idx'] = range(len(df_copy))
-    
-    # Linear regression
-    coeffs = np.polyfit(df_copy['time_idx'], df_copy[column], 1)
-    slope, intercept = coeffs
+        return {}
     
+    y = df[column].to_numpy(dtype=np.float64)
+    n = y.size
+    x = np.arange(n, dtype=np.float64)
+
+    # Closed-form degree-1 least squares; np.polyfit would build a
+    # Vandermonde matrix and go through LAPACK for the same two numbers
+    x_mean = x.mean()
+    y_mean = y.mean()
+    x_centered = x - x_mean
+    slope = np.dot(x_centered, y - y_mean) / np.dot(x_centered, x_centered)
+    intercept = y_mean - slope * x_mean
+
     # Forecast
-    future_idx = np.arange(len(df_copy), len(df_copy) + horizon)
+    future_idx = np.arange(n, n + horizon)
     forecast = slope * future_idx + intercept
-    
+
     # Confidence intervals
-    X = df_copy['time_idx'].values
-    y = df_copy[column].values
-    residuals = y - (slope * X + intercept)
-    std_residual = np.std(residuals)
-    
-    forecast_df = pd.DataFrame({
+    residuals = y - (slope * x + intercept)
+    band = 2 * np.std(residuals)
+
+    return {
         'forecast': forecast,
-        'lower_bound': forecast - 2 * std_residual,
-        'upper_bound': forecast + 2 * std_residual
-    })
-    
-    return forecast_df
+        'lower_bound': forecast - band,
+        'upper_bound': forecast + band
+    }
+
+
+def _centered_moving_mean(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    Centered moving average matching rolling(window, center=True).mean().
+
+    One cumulative-sum pass instead of the pandas Rolling scaffolding;
+    positions without a full window stay NaN.
+    """
+    out = np.full(arr.size, np.nan)
+    if arr.size >= window:
+        csum = np.cumsum(np.concatenate(([0.0], arr)))
+        means = (csum[window:] - csum[:-window]) / window
+        start = window // 2
+        out[start:start + means.size] = means
+    return out
 
 
-def decompose_trend(series: pd.Series, period: int = 12) -> Dict[str, pd.Series]:
+def decompose_trend(series: pd.Series, period: int = 12) -> Dict[str, np.ndarray]:
     """
     Decompose time series into trend, seasonal, and residual.
-    
+
     Args:
         series: Time series data
         period: Seasonal period
-        
+
     Returns:
-        Dictionary with components
+        Dictionary with component arrays aligned to the input positions
     """
-    trend = series.rolling(window=period, center=True).mean()
-    detrended = series - trend
-    seasonal = detrended.groupby(detrended.index % period).transform('mean')
-    residual = detrended - seasonal
-    
+    arr = series.to_numpy(dtype=np.float64)
+    trend_arr = _centered_moving_mean(arr, period)
+    detrended_arr = arr - trend_arr
+
+    # Per-period means via two bincount passes and a gather; the old
+    # groupby(...).transform('mean') went through the full pandas groupby
+    # machinery for the same result
+    idx = np.arange(arr.size) % period
+    valid = ~np.isnan(detrended_arr)
+    sums = np.bincount(idx[valid], weights=detrended_arr[valid], minlength=period)
+    counts = np.bincount(idx[valid], minlength=period)
+    means = np.divide(sums, counts, out=np.full(period, np.nan), where=counts > 0)
+    seasonal_arr = means[idx]
+
     return {
-        'trend': trend,
-        'seasonal': seasonal,
-        'residual': residual,
-        'observed': series
+        'trend': trend_arr,
+        'seasonal': seasonal_arr,
+        'residual': detrended_arr - seasonal_arr,
+        'observed': arr
     }
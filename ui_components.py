@@ -30,80 +30,87 @@ def render_kpi_card(label: str, value: str, delta: Optional[str] = None,
                        unsafe_allow_html=True)
 
 
-def render_health_gauge(score: float, title: str = "System Health Score"):
+@st.cache_resource
+def _gauge_figure(score_bucket: int, kind: str, title: str):
     """
-    Render health score gauge (0-100).
-    
+    Build and memoize a gauge figure for a whole-number score.
+
+    The nested Indicator/layout dicts are dozens of allocations per
+    build; caching on the rounded score means sub-point fluctuations
+    between refreshes reuse the same figure object.
+
     Args:
-        score: Health score
+        score_bucket: Score rounded to the nearest integer
+        kind: 'health' or 'risk'
         title: Gauge title
     """
+    score = score_bucket
+
+    if kind == 'health':
+        delta = {'reference': 80, 'increasing': {'color': "#00cc96"}}
+        bar_color = "#00cc96" if score >= 80 else "#ff8800" if score >= 60 else "#ff4444"
+        steps = [
+            {'range': [0, 60], 'color': 'rgba(255, 68, 68, 0.2)'},
+            {'range': [60, 80], 'color': 'rgba(255, 136, 0, 0.2)'},
+            {'range': [80, 100], 'color': 'rgba(0, 204, 150, 0.2)'}
+        ]
+        threshold_value = 80
+    else:
+        delta = {'reference': 50, 'increasing': {'color': "#ff4444"}, 'decreasing': {'color': "#00cc96"}}
+        bar_color = "#ff4444" if score >= 70 else "#ff8800" if score >= 40 else "#00cc96"
+        steps = [
+            {'range': [0, 40], 'color': 'rgba(0, 204, 150, 0.2)'},
+            {'range': [40, 70], 'color': 'rgba(255, 136, 0, 0.2)'},
+            {'range': [70, 100], 'color': 'rgba(255, 68, 68, 0.2)'}
+        ]
+        threshold_value = 50
+
     fig = go.Figure(go.Indicator(
         mode="gauge+number+delta",
         value=score,
         title={'text': title, 'font': {'size': 20}},
-        delta={'reference': 80, 'increasing': {'color': "#00cc96"}},
+        delta=delta,
         gauge={
             'axis': {'range': [0, 100], 'tickwidth': 1},
-            'bar': {'color': "#00cc96" if score >= 80 else "#ff8800" if score >= 60 else "#ff4444"},
-            'steps': [
-                {'range': [0, 60], 'color': 'rgba(255, 68, 68, 0.2)'},
-                {'range': [60, 80], 'color': 'rgba(255, 136, 0, 0.2)'},
-                {'range': [80, 100], 'color': 'rgba(0, 204, 150, 0.2)'}
-            ],
+            'bar': {'color': bar_color},
+            'steps': steps,
             'threshold': {
                 'line': {'color': "white", 'width': 4},
                 'thickness': 0.75,
-                'value': 80
+                'value': threshold_value
             }
         }
     ))
-    
+
     fig.update_layout(
         paper_bgcolor="rgba(0,0,0,0)",
         font={'color': "white", 'family': "Segoe UI"},
         height=300
     )
-    
+
     return fig
 
 
+def render_health_gauge(score: float, title: str = "System Health Score"):
+    """
+    Render health score gauge (0-100).
+
+    Args:
+        score: Health score
+        title: Gauge title
+    """
+    return _gauge_figure(int(round(score)), 'health', title)
+
+
 def render_risk_gauge(risk_index: float, title: str = "Risk Index"):
     """
     Render risk index gauge (0-100, higher = riskier).
-    
+
     Args:
         risk_index: Risk score
         title: Gauge title
     """
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number+delta",
-        value=risk_index,
-        title={'text': title, 'font': {'size': 20}},
-        delta={'reference': 50, 'increasing': {'color': "#ff4444"}, 'decreasing': {'color': "#00cc96"}},
-        gauge={
-            'axis': {'range': [0, 100], 'tickwidth': 1},
-            'bar': {'color': "#ff4444" if risk_index >= 70 else "#ff8800" if risk_index >= 40 else "#00cc96"},
-            'steps': [
-                {'range': [0, 40], 'color': 'rgba(0, 204, 150, 0.2)'},
-                {'range': [40, 70], 'color': 'rgba(255, 136, 0, 0.2)'},
-                {'range': [70, 100], 'color': 'rgba(255, 68, 68, 0.2)'}
-            ],
-            'threshold': {
-                'line': {'color': "white", 'width': 4},
-                'thickness': 0.75,
-                'value': 50
-            }
-        }
-    ))
-    
-    fig.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        font={'color': "white", 'family': "Segoe UI"},
-        height=300
-    )
-    
-    return fig
+    return _gauge_figure(int(round(risk_index)), 'risk', title)
 
 
 def render_alert_banner(message: str):
@@ -209,9 +216,12 @@ def apply_color_psychology(value: float, thresholds: dict) -> str:
     Returns:
         Color hex code
     """
-    if value >= thresholds.get('critical', 80):
+    critical = thresholds.get('critical', 80)
+    warning = thresholds.get('warning', 50)
+
+    if value >= critical:
         return '#ff4444'  # Red - Critical
-    elif value >= thresholds.get('warning', 50):
+    elif value >= warning:
         return '#ff8800'  # Orange - Warning
     else:
         return '#00cc96'  # Green - Healthy
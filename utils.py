@@ -5,41 +5,36 @@ Helper functions for export, calculations, and formatting.
 """
 
 import pandas as pd
-import base64
-from io import BytesIO
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
 
 
 def export_to_csv(data: pd.DataFrame, filename: str = "export.csv") -> bytes:
     """
     Export DataFrame to CSV.
-    
+
+    Uses pyarrow's multithreaded C++ CSV writer when available; the
+    pandas writer runs a Python-level serialization loop and a second
+    pass to encode the resulting str.
+
     Args:
         data: DataFrame to export
         filename: Output filename
-        
+
     Returns:
         CSV bytes
     """
+    if pa is not None:
+        buf = pa.BufferOutputStream()
+        pacsv.write_csv(pa.Table.from_pandas(data, preserve_index=False), buf)
+        return buf.getvalue().to_pybytes()
     return data.to_csv(index=False).encode('utf-8')
 
 
-def create_download_link(data: bytes, filename: str, link_text: str = "Download") -> str:
-    """
-    Create download link for data.
-    
-    Args:
-        data: File data as bytes
-        filename: Download filename
-        link_text: Link display text
-        
-    Returns:
-        HTML download link
-    """
-    b64 = base64.b64encode(data).decode()
-    href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">{link_text}</a>'
-    return href
-
-
 def calculate_trend_indicator(current: float, previous: float) -> str:
     """
     Calculate trend indicator symbol.
@@ -69,15 +64,17 @@ def format_number(value: float, decimals: int = 1) -> str:
     return f"{value:,.{decimals}f}"
 
 
+_SEVERITY_EMOJI = {
+    'CRITICAL': '🔴',
+    'WARNING': '🟡',
+    'SAFE': '🟢',
+    'INFO': '🔵'
+}
+
+
 def get_severity_emoji(severity: str) -> str:
     """Get emoji for severity level."""
-    emojis = {
-        'CRITICAL': '🔴',
-        'WARNING': '🟡',
-        'SAFE': '🟢',
-        'INFO': '🔵'
-    }
-    return emojis.get(severity, '⚪')
+    return _SEVERITY_EMOJI.get(severity, '⚪')
 
 
 def generate_insight_summary(health_score: float, risk_index: float, 